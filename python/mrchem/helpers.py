@@ -23,13 +23,14 @@
 # <https://mrchem.readthedocs.io/>
 #
 
+from functools import lru_cache
 from math import sqrt
 from pathlib import Path
 
 from .CUBEparser import parse_files
 
 # yapf: disable
-SHORTHAND_FUNCTIONALS = [
+SHORTHAND_FUNCTIONALS = frozenset({
     'svwn3',
     'svwn5',
     'pbe',
@@ -45,86 +46,122 @@ SHORTHAND_FUNCTIONALS = [
     'kt1',
     'kt2',
     'kt3'
-]
+})
 # yapf: enable
-"""List of recognized shorthands for functionals"""
+"""Set of recognized shorthands for functionals"""
+
+_ZETA_MAP = {"sz": 1, "dz": 2, "tz": 3, "qz": 4}
+"""Number of zeta functions for each initial guess basis label"""
+
+# yapf: disable
+_METHOD_ALIASES = {
+    'core': ('Core Hamiltonian', 'core', None),
+    'hartree': ('Hartree', 'hartree', None),
+    'hf': ('Hartree-Fock', 'hf', None),
+    'hartree-fock': ('Hartree-Fock', 'hf', None),
+    'hartreefock': ('Hartree-Fock', 'hf', None),
+    'dft': ('DFT', 'dft', None),
+    'lda': ('DFT (SVWN5)', 'dft', 'svwn5'),
+}
+# yapf: enable
+"""Wavefunction methods as (method_name, method_type, dft_funcs override)"""
 
 
 def write_scf_fock(user_dict, wf_dict, origin):
     fock_dict = {}
 
+    wf = user_dict["WaveFunction"]
+    prec = user_dict["Precisions"]
+    mpi = user_dict["MPI"]
+    zora = user_dict["ZORA"]
+    deriv = user_dict["Derivatives"]
+
     # ZORA
-    if user_dict["WaveFunction"]["relativity"].lower() == "zora":
+    if wf["relativity"].lower() == "zora":
         fock_dict["zora_operator"] = {
-            "include_nuclear": user_dict["ZORA"]["include_nuclear"],
-            "include_coulomb": user_dict["ZORA"]["include_coulomb"],
-            "include_xc": user_dict["ZORA"]["include_xc"],
+            "include_nuclear": zora["include_nuclear"],
+            "include_coulomb": zora["include_coulomb"],
+            "include_xc": zora["include_xc"],
         }
 
     # Kinetic
-    fock_dict["kinetic_operator"] = {"derivative": user_dict["Derivatives"]["kinetic"]}
+    fock_dict["kinetic_operator"] = {"derivative": deriv["kinetic"]}
 
     # Nuclear
     fock_dict["nuclear_operator"] = {
-        "proj_prec": user_dict["Precisions"]["nuclear_prec"],
-        "smooth_prec": user_dict["Precisions"]["nuclear_prec"],
-        "nuclear_model": user_dict["WaveFunction"]["nuclear_model"],
-        "shared_memory": user_dict["MPI"]["share_nuclear_potential"],
+        "proj_prec": prec["nuclear_prec"],
+        "smooth_prec": prec["nuclear_prec"],
+        "nuclear_model": wf["nuclear_model"],
+        "shared_memory": mpi["share_nuclear_potential"],
     }
 
     # Reaction
-    if user_dict["WaveFunction"]["environment"].lower() != "none":
+    if wf["environment"].lower() != "none":
         fock_dict["reaction_operator"] = _reaction_operator_handler(user_dict)
 
     # Coulomb
     if wf_dict["method_type"] in ["hartree", "hf", "dft"]:
         fock_dict["coulomb_operator"] = {
-            "poisson_prec": user_dict["Precisions"]["poisson_prec"],
-            "shared_memory": user_dict["MPI"]["share_coulomb_potential"],
+            "poisson_prec": prec["poisson_prec"],
+            "shared_memory": mpi["share_coulomb_potential"],
         }
 
     # Exchange
     if wf_dict["method_type"] in ["hf", "dft"]:
         fock_dict["exchange_operator"] = {
-            "poisson_prec": user_dict["Precisions"]["poisson_prec"],
-            "exchange_prec": user_dict["Precisions"]["exchange_prec"],
+            "poisson_prec": prec["poisson_prec"],
+            "exchange_prec": prec["exchange_prec"],
         }
 
     # Exchange-Correlation
     if wf_dict["method_type"] in ["dft"]:
-        func_dict = []
-        for line in wf_dict["dft_funcs"].split("\n"):
-            sp = line.split()
-            if len(sp) > 0:
-                func = sp[0].lower()
-                coef = [1.0]
-                if len(sp) > 1:
-                    coef = list(map(float, sp[1:]))
-                func_dict.append({"name": func, "coef": coef[0]})
-        fock_dict["xc_operator"] = {
-            "shared_memory": user_dict["MPI"]["share_xc_potential"],
-            "xc_functional": {
-                "spin": user_dict["DFT"]["spin"],
-                "cutoff": user_dict["DFT"]["density_cutoff"],
-                "functionals": func_dict,
-            },
-        }
+        fock_dict["xc_operator"] = _build_xc_operator(user_dict, wf_dict)
 
     # External electric field
-    if len(user_dict["ExternalFields"]["electric_field"]) > 0:
+    electric_field = user_dict["ExternalFields"]["electric_field"]
+    if len(electric_field) > 0:
         fock_dict["external_operator"] = {
-            "electric_field": user_dict["ExternalFields"]["electric_field"],
+            "electric_field": electric_field,
             "r_O": origin,
         }
 
     return fock_dict
 
 
+def _build_xc_operator(user_dict, wf_dict):
+    func_dict = []
+    for line in wf_dict["dft_funcs"].split("\n"):
+        sp = line.split()
+        if len(sp) > 0:
+            func = sp[0].lower()
+            coef = [1.0]
+            if len(sp) > 1:
+                coef = list(map(float, sp[1:]))
+            func_dict.append({"name": func, "coef": coef[0]})
+
+    dft = user_dict["DFT"]
+    xc_dict = {
+        "shared_memory": user_dict["MPI"]["share_xc_potential"],
+        "xc_functional": {
+            "spin": dft["spin"],
+            "cutoff": dft["density_cutoff"],
+            "functionals": func_dict,
+        },
+    }
+    return xc_dict
+
+
 def _reaction_operator_handler(user_dict, rsp=False):
+    pcm = user_dict["PCM"]
+    scrf = pcm["SCRF"]
+    perm = pcm["Solvent"]["Permittivity"]
+    eps_out = perm["epsilon_out"]
+    dhs = pcm["Solvent"]["DebyeHuckelScreening"]
+
     # convert density_type from string to integer
-    if user_dict["PCM"]["SCRF"]["density_type"] == "total":
+    if scrf["density_type"] == "total":
         density_type = 0
-    elif user_dict["PCM"]["SCRF"]["density_type"] == "electronic":
+    elif scrf["density_type"] == "electronic":
         density_type = 1
     else:
         density_type = 2
@@ -133,30 +170,35 @@ def _reaction_operator_handler(user_dict, rsp=False):
     reo_dict = {
         "solver_type": "Generalized_Poisson",
         "poisson_prec": user_dict["world_prec"],
-        "kain": user_dict["PCM"]["SCRF"]["kain"],
-        "max_iter": user_dict["PCM"]["SCRF"]["max_iter"],
-        "dynamic_thrs": user_dict["PCM"]["SCRF"]["dynamic_thrs"],
+        "kain": scrf["kain"],
+        "max_iter": scrf["max_iter"],
+        "dynamic_thrs": scrf["dynamic_thrs"],
         # if doing a response calculation, then density_type is set to 1 (electronic only)
         "density_type": 1 if rsp else density_type,
-        "epsilon_in": user_dict["PCM"]["Solvent"]["Permittivity"]["epsilon_in"],
-        "epsilon_static": user_dict["PCM"]["Solvent"]["Permittivity"]["epsilon_out"]["static"],
-        "epsilon_dynamic": user_dict["PCM"]["Solvent"]["Permittivity"]["epsilon_out"]["dynamic"],
-        "nonequilibrium": user_dict["PCM"]["Solvent"]["Permittivity"]["epsilon_out"][
-            "nonequilibrium"
-        ],
-        "formulation": user_dict["PCM"]["Solvent"]["Permittivity"]["formulation"],
+        "epsilon_in": perm["epsilon_in"],
+        "epsilon_static": eps_out["static"],
+        "epsilon_dynamic": eps_out["dynamic"],
+        "nonequilibrium": eps_out["nonequilibrium"],
+        "formulation": perm["formulation"],
         "kappa_out": 0.0,
-        "ion_radius": user_dict["PCM"]["Solvent"]["DebyeHuckelScreening"]["ion_radius"],
-        "ion_width": user_dict["PCM"]["Solvent"]["DebyeHuckelScreening"]["ion_width"],
-        "DHS-formulation": user_dict["PCM"]["Solvent"]["DebyeHuckelScreening"]["formulation"],
+        "ion_radius": dhs["ion_radius"],
+        "ion_width": dhs["ion_width"],
+        "DHS-formulation": dhs["formulation"],
     }
 
     # ionic solvent continuum model
     ionic_model = user_dict["WaveFunction"]["environment"].lower().split("_")[-1]
     if ionic_model in ("pb", "lpb"):
-        permittivity = user_dict["PCM"]["Solvent"]["Permittivity"]["epsilon_out"]["static"]
-        ionic_strength = user_dict["PCM"]["Solvent"]["DebyeHuckelScreening"]["ion_strength"]
-        kappa_out = compute_kappa(user_dict["Constants"], permittivity, ionic_strength)
+        constants = user_dict["Constants"]
+        kappa_out = compute_kappa(
+            constants["boltzmann_constant"],
+            constants["elementary_charge"],
+            constants["e0"],
+            constants["N_a"],
+            constants["meter2bohr"],
+            eps_out["static"],
+            dhs["ion_strength"],
+        )
         reo_dict |= {
             "kappa_out": kappa_out,
             "solver_type": "Poisson-Boltzmann"
@@ -190,17 +232,10 @@ def write_scf_guess(user_dict, wf_dict):
 
     if guess_type in ["core", "sad"]:
         zeta_str = guess_str.split("_")[1]
-        if zeta_str == "sz":
-            zeta = 1
-        elif zeta_str == "dz":
-            zeta = 2
-        elif zeta_str == "tz":
-            zeta = 3
-        elif zeta_str == "qz":
-            zeta = 4
-        elif zeta_str == "gto":
+        zeta = _ZETA_MAP.get(zeta_str, 0)
+        if zeta_str == "gto":
             guess_type = guess_str
-        else:
+        elif zeta == 0:
             print("Invalid zeta:" + zeta_str)
 
     file_dict = user_dict["Files"]
@@ -341,22 +376,35 @@ def write_rsp_calc(omega, user_dict, origin):
     user_guess_type = guess_str.split("_")[0]
     user_guess_prec = rsp_dict["guess_prec"]
 
+    # file path prefixes are the same for all directions
+    chk = rsp_dict["path_checkpoint"]
+    chk_x = chk + "/X_rsp_"
+    chk_y = chk + "/Y_rsp_"
+    guess_x_p = file_dict["guess_x_p"] + "_rsp_"
+    guess_x_a = file_dict["guess_x_a"] + "_rsp_"
+    guess_x_b = file_dict["guess_x_b"] + "_rsp_"
+    guess_y_p = file_dict["guess_y_p"] + "_rsp_"
+    guess_y_a = file_dict["guess_y_a"] + "_rsp_"
+    guess_y_b = file_dict["guess_y_b"] + "_rsp_"
     vector_dir = file_dict["cube_vectors"]
+    path_orbitals = rsp_dict["path_orbitals"]
+    write_orbitals = rsp_dict["write_orbitals"]
 
     rsp_calc["components"] = []
     for dir in [0, 1, 2]:
         rsp_comp = {}
+        d = str(dir)
 
         program_guess_type = user_guess_type
         program_guess_prec = user_guess_prec
 
         # check that initial guess files exist
         if user_guess_type == "chk":
-            chk_X = Path(f"{rsp_dict['path_checkpoint']}/X_rsp_{dir:d}")
-            chk_Y = Path(f"{rsp_dict['path_checkpoint']}/Y_rsp_{dir:d}")
+            chk_X = Path(chk_x + d)
+            chk_Y = Path(chk_y + d)
             if not (chk_X.is_file() and chk_Y.is_file()):
                 print(
-                    f"No checkpoint guess found in {rsp_dict['path_checkpoint']} for direction {dir:d}, falling back to zero initial guess"
+                    f"No checkpoint guess found in {chk} for direction {d}, falling back to zero initial guess"
                 )
                 program_guess_type = "none"
             else:
@@ -366,7 +414,7 @@ def write_rsp_calc(omega, user_dict, origin):
             found = parse_files(user_dict, dir)
             if not found:
                 print(
-                    f"No CUBE guess found in any of the 'initial_guess' sub-folders for direction {dir:d}, falling back to zero initial guess"
+                    f"No CUBE guess found in any of the 'initial_guess' sub-folders for direction {d}, falling back to zero initial guess"
                 )
                 program_guess_type = "none"
         else:
@@ -376,30 +424,29 @@ def write_rsp_calc(omega, user_dict, origin):
         rsp_comp["initial_guess"] = {
             "prec": program_guess_prec,
             "type": program_guess_type,
-            "file_chk_x": f"{rsp_dict['path_checkpoint']}/X_rsp_{dir:d}",
-            "file_chk_y": f"{rsp_dict['path_checkpoint']}/Y_rsp_{dir:d}",
-            "file_x_p": f"{file_dict['guess_x_p']}_rsp_{dir:d}",
-            "file_x_a": f"{file_dict['guess_x_a']}_rsp_{dir:d}",
-            "file_x_b": f"{file_dict['guess_x_b']}_rsp_{dir:d}",
-            "file_y_p": f"{file_dict['guess_y_p']}_rsp_{dir:d}",
-            "file_y_a": f"{file_dict['guess_y_a']}_rsp_{dir:d}",
-            "file_y_b": f"{file_dict['guess_y_b']}_rsp_{dir:d}",
-            "file_CUBE_x_p": f"{vector_dir}CUBE_x_p_{dir:d}_vector.json",
-            "file_CUBE_x_a": f"{vector_dir}CUBE_x_a_{dir:d}_vector.json",
-            "file_CUBE_x_b": f"{vector_dir}CUBE_x_b_{dir:d}_vector.json",
-            "file_CUBE_y_p": f"{vector_dir}CUBE_y_p_{dir:d}_vector.json",
-            "file_CUBE_y_a": f"{vector_dir}CUBE_y_a_{dir:d}_vector.json",
-            "file_CUBE_y_b": f"{vector_dir}CUBE_y_b_{dir:d}_vector.json",
+            "file_chk_x": chk_x + d,
+            "file_chk_y": chk_y + d,
+            "file_x_p": guess_x_p + d,
+            "file_x_a": guess_x_a + d,
+            "file_x_b": guess_x_b + d,
+            "file_y_p": guess_y_p + d,
+            "file_y_a": guess_y_a + d,
+            "file_y_b": guess_y_b + d,
+            "file_CUBE_x_p": vector_dir + "CUBE_x_p_" + d + "_vector.json",
+            "file_CUBE_x_a": vector_dir + "CUBE_x_a_" + d + "_vector.json",
+            "file_CUBE_x_b": vector_dir + "CUBE_x_b_" + d + "_vector.json",
+            "file_CUBE_y_p": vector_dir + "CUBE_y_p_" + d + "_vector.json",
+            "file_CUBE_y_a": vector_dir + "CUBE_y_a_" + d + "_vector.json",
+            "file_CUBE_y_b": vector_dir + "CUBE_y_b_" + d + "_vector.json",
         }
-        if rsp_dict["write_orbitals"]:
-            path_orbitals = rsp_dict["path_orbitals"]
+        if write_orbitals:
             rsp_comp["write_orbitals"] = {
-                "file_x_p": f"{path_orbitals}/X_p_rsp_{dir:d}",
-                "file_x_a": f"{path_orbitals}/X_a_rsp_{dir:d}",
-                "file_x_b": f"{path_orbitals}/X_b_rsp_{dir:d}",
-                "file_y_p": f"{path_orbitals}/Y_p_rsp_{dir:d}",
-                "file_y_a": f"{path_orbitals}/Y_a_rsp_{dir:d}",
-                "file_y_b": f"{path_orbitals}/Y_b_rsp_{dir:d}",
+                "file_x_p": path_orbitals + "/X_p_rsp_" + d,
+                "file_x_a": path_orbitals + "/X_a_rsp_" + d,
+                "file_x_b": path_orbitals + "/X_b_rsp_" + d,
+                "file_y_p": path_orbitals + "/Y_p_rsp_" + d,
+                "file_y_a": path_orbitals + "/Y_a_rsp_" + d,
+                "file_y_b": path_orbitals + "/Y_b_rsp_" + d,
             }
         if rsp_dict["run"][dir]:
             rsp_comp["rsp_solver"] = write_rsp_solver(user_dict, wf_dict, dir)
@@ -410,39 +457,25 @@ def write_rsp_calc(omega, user_dict, origin):
 def write_rsp_fock(user_dict, wf_dict):
     fock_dict = {}
 
+    prec = user_dict["Precisions"]
+
     # Coulomb
     if wf_dict["method_type"] in ["hartree", "hf", "dft"]:
         fock_dict["coulomb_operator"] = {
-            "poisson_prec": user_dict["Precisions"]["poisson_prec"],
+            "poisson_prec": prec["poisson_prec"],
             "shared_memory": user_dict["MPI"]["share_coulomb_potential"],
         }
 
     # Exchange
     if wf_dict["method_type"] in ["hf", "dft"]:
         fock_dict["exchange_operator"] = {
-            "poisson_prec": user_dict["Precisions"]["poisson_prec"],
-            "exchange_prec": user_dict["Precisions"]["exchange_prec"],
+            "poisson_prec": prec["poisson_prec"],
+            "exchange_prec": prec["exchange_prec"],
         }
 
     # Exchange-Correlation
     if wf_dict["method_type"] in ["dft"]:
-        func_dict = []
-        for line in wf_dict["dft_funcs"].split("\n"):
-            sp = line.split()
-            if len(sp) > 0:
-                func = sp[0].lower()
-                coef = [1.0]
-                if len(sp) > 1:
-                    coef = list(map(float, sp[1:]))
-                func_dict.append({"name": func, "coef": coef[0]})
-        fock_dict["xc_operator"] = {
-            "shared_memory": user_dict["MPI"]["share_xc_potential"],
-            "xc_functional": {
-                "spin": user_dict["DFT"]["spin"],
-                "cutoff": user_dict["DFT"]["density_cutoff"],
-                "functionals": func_dict,
-            },
-        }
+        fock_dict["xc_operator"] = _build_xc_operator(user_dict, wf_dict)
 
     # Reaction
     if user_dict["WaveFunction"]["environment"].lower() != "none":
@@ -479,105 +512,104 @@ def write_rsp_solver(user_dict, wf_dict, d):
 
 
 def parse_wf_method(user_dict):
-    method_name = ""
-    restricted = user_dict["WaveFunction"]["restricted"]
-    method_type = user_dict["WaveFunction"]["method"].lower()
-    dft_funcs = user_dict["DFT"]["functionals"].lower()
-    if method_type in ["core"]:
-        method_name = "Core Hamiltonian"
-    elif method_type in ["hartree"]:
-        method_name = "Hartree"
-    elif method_type in ["hf", "hartree-fock", "hartreefock"]:
-        method_name = "Hartree-Fock"
-        method_type = "hf"
-    elif method_type in ["dft"]:
-        method_name = "DFT"
-    elif method_type in ["lda"]:
-        method_name = "DFT (SVWN5)"
-        dft_funcs = "svwn5"
-        method_type = "dft"
+    wf = user_dict["WaveFunction"]
+    zora = user_dict["ZORA"]
+    zora_terms = (zora["include_nuclear"], zora["include_coulomb"], zora["include_xc"])
+
+    wf_items, relativity, zora_terms = _parse_wf_method_cached(
+        wf["method"],
+        wf["relativity"],
+        wf["restricted"],
+        user_dict["DFT"]["functionals"],
+        tuple(user_dict["ExternalFields"]["electric_field"]),
+        wf["environment"],
+        zora_terms,
+    )
+
+    # Re-apply the relativity settings implied by the chosen method
+    wf["relativity"] = relativity
+    zora["include_nuclear"], zora["include_coulomb"], zora["include_xc"] = zora_terms
+
+    return dict(wf_items)
+
+
+@lru_cache(maxsize=8)
+def _parse_wf_method_cached(
+    method, relativity, restricted, dft_funcs, ef_tuple, environment, zora_terms
+):
+    method_type = method.lower()
+    dft_funcs = dft_funcs.lower()
+    alias = _METHOD_ALIASES.get(method_type)
+    if alias is not None:
+        method_name, method_type, funcs = alias
+        if funcs is not None:
+            dft_funcs = funcs
     elif method_type in SHORTHAND_FUNCTIONALS:
         method_name = "DFT (" + method_type.upper() + ")"
         dft_funcs = method_type
         method_type = "dft"
     else:
-        raise RuntimeError(
-            f"Invalid wavefunction method {user_dict['WaveFunction']['method']}"
-        )
+        raise RuntimeError(f"Invalid wavefunction method {method}")
 
     # Determine relativity name label for print outs to the output file
     relativity_name = "None"
-    if user_dict["WaveFunction"]["relativity"].lower() in ["none"]:
-        user_dict["WaveFunction"]["relativity"] = "off"
-        user_dict["ZORA"]["include_nuclear"] = False
-        user_dict["ZORA"]["include_coulomb"] = False
-        user_dict["ZORA"]["include_xc"] = False
-
-    if user_dict["WaveFunction"]["relativity"].lower() in ["nzora"]:
-        user_dict["WaveFunction"]["relativity"] = "zora"
-        user_dict["ZORA"]["include_nuclear"] = True
-        user_dict["ZORA"]["include_coulomb"] = False
-        user_dict["ZORA"]["include_xc"] = False
-
-    if user_dict["WaveFunction"]["relativity"].lower() in ["zora"]:
-        components = [
-            user_dict["ZORA"]["include_nuclear"],
-            user_dict["ZORA"]["include_coulomb"],
-            user_dict["ZORA"]["include_xc"],
-        ]
+    if relativity.lower() in ["none"]:
+        relativity = "off"
+        zora_terms = (False, False, False)
+
+    if relativity.lower() in ["nzora"]:
+        relativity = "zora"
+        zora_terms = (True, False, False)
+
+    if relativity.lower() in ["zora"]:
         names = ["V_nuc", "J", "V_xc"]
 
-        if any(components):
-            zora_terms = " + ".join(
-                [name for name, comp in zip(names, components) if comp]
+        if any(zora_terms):
+            zora_names = " + ".join(
+                [name for name, comp in zip(names, zora_terms) if comp]
             )
-            relativity_name = "ZORA (" + zora_terms + ")"
+            relativity_name = "ZORA (" + zora_names + ")"
         else:
             raise RuntimeError("ZORA selected, but no ZORA potential included")
 
-        if user_dict["ZORA"]["include_xc"] and not restricted:
+        if zora_terms[2] and not restricted:
             raise RuntimeError(
                 "ZORA (V_xc) not available for unrestricted wavefunctions"
             )
 
     # Determine environment name label for print outs to the output file
     environment_name = "None"
-    if user_dict["WaveFunction"]["environment"].lower() == "pcm":
+    if environment.lower() == "pcm":
         environment_name = "PCM"
 
     # Determine external name label for print outs to the output file
-    ext_dict = user_dict["ExternalFields"]
-    has_external_fields = len(ext_dict["electric_field"]) > 0
+    has_external_fields = len(ef_tuple) > 0
 
     external_name = "None"
     if has_external_fields:
         # If no external fields, then the list will be empty
         # Need to catch the exception and store placeholders
         try:
-            x, y, z = ext_dict["electric_field"]
+            x, y, z = ef_tuple
         except ValueError:
             x, y, z = None, None, None  # Useless placeholders
 
         # Labels to aggregate
         external_name = f"Electric field ({x}, {y}, {z})"
 
-    wf_dict = {
-        "relativity_name": relativity_name,
-        "environment_name": environment_name,
-        "external_name": external_name,
-        "method_name": method_name,
-        "method_type": method_type,
-        "dft_funcs": dft_funcs,
-    }
-    return wf_dict
+    wf_items = (
+        ("relativity_name", relativity_name),
+        ("environment_name", environment_name),
+        ("external_name", external_name),
+        ("method_name", method_name),
+        ("method_type", method_type),
+        ("dft_funcs", dft_funcs),
+    )
+    return wf_items, relativity, zora_terms
 
 
-def compute_kappa(constants, eps, I):
-    kb = constants["boltzmann_constant"]
-    e = constants["elementary_charge"]
-    e_0 = constants["e0"]
-    N_a = constants["N_a"]
-    m2au = constants["meter2bohr"]
+@lru_cache(maxsize=8)
+def compute_kappa(kb, e, e_0, N_a, m2au, eps, I):
     T = 298.15
 
     numerator = e_0 * eps * kb * T